@@ -1,28 +1,78 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import Dict, List
+from matplotlib.figure import Figure
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 import os
+from pathlib import Path
 
 class PerformanceAnalyzer:
-    def __init__(self, trade_log: List[Dict], initial_capital: float):
+    def __init__(self, trade_log: Union[List[Dict], pd.DataFrame], initial_capital: float):
         """
         Initialize the performance analyzer
-        :param trade_log: List of trade dictionaries
+        :param trade_log: List of trade dictionaries or a trade DataFrame
         :param initial_capital: Initial capital
         """
-        self.trade_log = pd.DataFrame(trade_log)
+        self.trade_log = trade_log
         self.initial_capital = initial_capital
+        self._fig: Optional[Figure] = None
         
         # Create output directory for charts
         self.output_dir = os.path.join(os.path.dirname(__file__), '..', 'output', 'analytics')
         os.makedirs(self.output_dir, exist_ok=True)
 
+    @property
+    def trade_log(self) -> pd.DataFrame:
+        return self._trade_log
+
+    @trade_log.setter
+    def trade_log(self, trade_log: Union[List[Dict], pd.DataFrame]) -> None:
+        """
+        Replace the trade log and invalidate cached results
+        """
+        self._trade_log = pd.DataFrame(trade_log)
+
+        # Materialize numeric columns once as contiguous float64 arrays
+        if self._trade_log.empty:
+            self._pv = np.empty(0, dtype=np.float64)
+            self._pnl = np.empty(0, dtype=np.float64)
+        else:
+            self._pv = self._trade_log['portfolio_value'].to_numpy(dtype=np.float64, copy=False)
+            self._pnl = self._trade_log['pnl'].to_numpy(dtype=np.float64)
+
+        self._metrics = None
+        self._drawdowns = None
+
+    def _new_axes(self, save: bool):
+        """
+        Get a clean figure and axes for a chart. Saved charts reuse one
+        pyplot-free Figure, so no GUI backend is started and nothing is
+        left in pyplot's figure registry.
+        """
+        if not save:
+            return plt.subplots(figsize=(12, 6))
+
+        if self._fig is None:
+            self._fig = Figure(figsize=(12, 6))
+        self._fig.clear()
+        return self._fig, self._fig.subplots()
+
+    def _get_drawdowns(self) -> np.ndarray:
+        """
+        Drawdown series as fractions of the running peak, computed once
+        """
+        if self._drawdowns is None:
+            self._drawdowns = self._pv / np.maximum.accumulate(self._pv) - 1.0
+        return self._drawdowns
+
     def calculate_metrics(self) -> Dict:
         """
         Calculate various performance metrics
         """
+        if self._metrics is not None:
+            return dict(self._metrics)
+
         if self.trade_log.empty:
             return {
                 "total_return": 0,
@@ -34,27 +84,28 @@ class PerformanceAnalyzer:
             }
 
         # Calculate daily returns
-        portfolio_values = self.trade_log['portfolio_value'].values
+        portfolio_values = self._pv
         daily_returns = np.diff(portfolio_values) / portfolio_values[:-1]
 
         # Calculate metrics
+        pnl = self._pnl
+        valid = ~np.isnan(pnl)
         total_return = (portfolio_values[-1] - self.initial_capital) / self.initial_capital * 100
-        winning_trades = self.trade_log[self.trade_log['pnl'] > 0]['pnl'].count()
-        total_trades = len(self.trade_log[self.trade_log['pnl'].notna()])
+        winning_trades = int((pnl > 0).sum())
+        total_trades = int(valid.sum())
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-        avg_profit = self.trade_log['pnl'].mean() if not self.trade_log['pnl'].empty else 0
+        avg_profit = pnl[valid].mean() if total_trades > 0 else 0
 
         # Calculate maximum drawdown
-        cumulative_max = np.maximum.accumulate(portfolio_values)
-        drawdowns = (portfolio_values - cumulative_max) / cumulative_max
-        max_drawdown = np.min(drawdowns) * 100 if len(drawdowns) > 0 else 0
+        drawdowns = self._get_drawdowns()
+        max_drawdown = drawdowns.min() * 100
 
         # Calculate Sharpe Ratio (assuming risk-free rate of 0.01)
         risk_free_rate = 0.01
         excess_returns = daily_returns - risk_free_rate/252
         sharpe_ratio = np.sqrt(252) * excess_returns.mean() / excess_returns.std() if len(daily_returns) > 0 else 0
 
-        return {
+        self._metrics = {
             "total_return": total_return,
             "win_rate": win_rate,
             "avg_profit_per_trade": avg_profit,
@@ -62,53 +113,56 @@ class PerformanceAnalyzer:
             "sharpe_ratio": sharpe_ratio,
             "total_trades": total_trades
         }
+        return dict(self._metrics)
 
-    def plot_equity_curve(self, save: bool = True) -> None:
+    def plot_equity_curve(self, save: bool = True, ts: Optional[str] = None) -> None:
         """
         Plot the equity curve
+        :param save: Save the chart to the output directory instead of showing it
+        :param ts: Timestamp used in the chart filename (defaults to now)
         """
         if self.trade_log.empty:
             return
 
-        plt.figure(figsize=(12, 6))
-        plt.plot(self.trade_log['timestamp'], self.trade_log['portfolio_value'],
+        fig, ax = self._new_axes(save)
+        ax.plot(self.trade_log['timestamp'], self.trade_log['portfolio_value'],
                 label='Portfolio Value', color='blue')
-        plt.title('Equity Curve')
-        plt.xlabel('Time')
-        plt.ylabel('Portfolio Value ($)')
-        plt.grid(True)
-        plt.legend()
+        ax.set_title('Equity Curve')
+        ax.set_xlabel('Time')
+        ax.set_ylabel('Portfolio Value ($)')
+        ax.grid(True)
+        ax.legend()
 
         if save:
-            filename = f'equity_curve_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            plt.savefig(os.path.join(self.output_dir, filename))
-            plt.close()
+            ts = ts or datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f'equity_curve_{ts}.png'
+            fig.savefig(os.path.join(self.output_dir, filename))
         else:
             plt.show()
 
-    def plot_drawdown(self, save: bool = True) -> None:
+    def plot_drawdown(self, save: bool = True, ts: Optional[str] = None) -> None:
         """
         Plot the drawdown chart
+        :param save: Save the chart to the output directory instead of showing it
+        :param ts: Timestamp used in the chart filename (defaults to now)
         """
         if self.trade_log.empty:
             return
 
-        portfolio_values = self.trade_log['portfolio_value'].values
-        cumulative_max = np.maximum.accumulate(portfolio_values)
-        drawdowns = (portfolio_values - cumulative_max) / cumulative_max * 100
+        drawdowns = self._get_drawdowns() * 100
 
-        plt.figure(figsize=(12, 6))
-        plt.plot(self.trade_log['timestamp'], drawdowns, label='Drawdown %', color='red')
-        plt.title('Portfolio Drawdown')
-        plt.xlabel('Time')
-        plt.ylabel('Drawdown (%)')
-        plt.grid(True)
-        plt.legend()
+        fig, ax = self._new_axes(save)
+        ax.plot(self.trade_log['timestamp'], drawdowns, label='Drawdown %', color='red')
+        ax.set_title('Portfolio Drawdown')
+        ax.set_xlabel('Time')
+        ax.set_ylabel('Drawdown (%)')
+        ax.grid(True)
+        ax.legend()
 
         if save:
-            filename = f'drawdown_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            plt.savefig(os.path.join(self.output_dir, filename))
-            plt.close()
+            ts = ts or datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f'drawdown_{ts}.png'
+            fig.savefig(os.path.join(self.output_dir, filename))
         else:
             plt.show()
 
@@ -117,16 +171,18 @@ class PerformanceAnalyzer:
         Generate a performance report
         """
         metrics = self.calculate_metrics()
+        now = datetime.now()
+        ts = now.strftime("%Y%m%d_%H%M%S")
         
         # Generate plots
-        self.plot_equity_curve()
-        self.plot_drawdown()
+        self.plot_equity_curve(ts=ts)
+        self.plot_drawdown(ts=ts)
         
         # Create report
         report = f"""
         Performance Report
         =================
-        Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        Generated on: {now.strftime('%Y-%m-%d %H:%M:%S')}
 
         Summary Metrics:
         ---------------
@@ -141,10 +197,7 @@ class PerformanceAnalyzer:
         """
         
         # Save report to file
-        report_file = os.path.join(self.output_dir, 
-                                 f'report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt')
-        with open(report_file, 'w') as f:
-            f.write(report)
+        Path(self.output_dir, f'report_{ts}.txt').write_text(report)
         
         return report
 
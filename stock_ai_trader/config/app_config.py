@@ -1,9 +1,13 @@
 import os
+import pickle
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 @dataclass
 class TradingConfig:
     symbols: list[str]
@@ -32,6 +36,7 @@ class AppConfig:
         """
         self.config_dir = os.path.dirname(__file__)
         self.config_file = os.path.join(self.config_dir, 'config.yaml')
+        self.cache_file = self.config_file + '.cache.pkl'
         self.config_data = self._load_config()
 
         # Initialize configuration objects
@@ -41,13 +46,52 @@ class AppConfig:
 
     def _load_config(self) -> Dict[str, Any]:
         """
-        Load configuration from YAML file
+        Load configuration from YAML file, using the pickled cache
+        when it was built from the current version of the file
         """
         if not os.path.exists(self.config_file):
             self._create_default_config()
 
+        # Nanosecond mtime plus size, so a rewrite within the filesystem's
+        # mtime granularity still invalidates the cache
+        st = os.stat(self.config_file)
+        key = (st.st_mtime_ns, st.st_size)
+        config_data = self._read_cache(key)
+        if config_data is not None:
+            return config_data
+
         with open(self.config_file, 'r') as f:
-            return yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_YAML_LOADER)
+
+        self._write_cache(key, config_data)
+        return config_data
+
+    def _read_cache(self, key: tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """
+        Return cached configuration if it was built from the YAML file
+        identified by key; anything unexpected is a cache miss
+        """
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            return None
+
+        if not isinstance(cached, dict) or cached.get('key') != key:
+            return None
+        config_data = cached.get('config')
+        return config_data if isinstance(config_data, dict) else None
+
+    def _write_cache(self, key: tuple[int, int], config_data: Dict[str, Any]) -> None:
+        """
+        Write parsed configuration next to the YAML file
+        """
+        try:
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump({'key': key, 'config': config_data}, f)
+        except OSError:
+            # Caching is best effort; a read-only config dir is fine
+            pass
 
     def _create_default_config(self) -> None:
         """
@@ -141,11 +185,23 @@ class AppConfig:
         with open(self.config_file, 'w') as f:
             yaml.dump(config_data, f, default_flow_style=False)
 
-# Create singleton instance
-config = AppConfig()
+# Singleton instance, created on first access to ``config``
+_config: Optional[AppConfig] = None
+
+def __getattr__(name: str) -> Any:
+    """
+    Build the configuration lazily so importing this module does no I/O
+    """
+    global _config
+    if name == 'config':
+        if _config is None:
+            _config = AppConfig()
+        return _config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     # Example usage
+    config = __getattr__('config')
     print("Trading Configuration:")
     print(f"Symbols: {config.trading.symbols}")
     print(f"Initial Capital: ${config.trading.initial_capital:,.2f}")
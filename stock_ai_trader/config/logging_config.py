@@ -1,7 +1,58 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import sys
+import threading
 from datetime import datetime
+from typing import Optional
+
+class CachedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that checks whether the log path is a regular file
+    once at construction instead of stat-ing it on every emitted record
+    """
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        # See bpo-45401: never roll over anything other than regular files
+        self._is_regular_file = (not os.path.exists(self.baseFilename)
+                                 or os.path.isfile(self.baseFilename))
+
+    def shouldRollover(self, record) -> bool:
+        if not self._is_regular_file:
+            return False
+        if self.stream is None:  # delay was set...
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            self.stream.seek(0, 2)  # due to non-posix-compliant Windows feature
+            pos = self.stream.tell()
+            if not pos:
+                # gh-116263: never roll over an empty file
+                return False
+            msg = "%s\n" % self.format(record)
+            if pos + len(msg) >= self.maxBytes:
+                return True
+        return False
+
+# Python 3.12+ already skips the per-record stat, so only override older versions
+RotatingFileHandler = (CachedRotatingFileHandler if sys.version_info < (3, 12)
+                       else logging.handlers.RotatingFileHandler)
+
+class CachedLogRecord(logging.LogRecord):
+    """
+    LogRecord that interpolates its message once and reuses it for every
+    handler, as long as msg and args have not been replaced since
+    """
+    _cached_message = None
+    _cached_for = None
+
+    def getMessage(self) -> str:
+        cached_for = self._cached_for
+        if cached_for is None or cached_for[0] is not self.msg or cached_for[1] is not self.args:
+            self._cached_message = super().getMessage()
+            self._cached_for = (self.msg, self.args)
+        return self._cached_message
 
 class LoggingConfig:
     def __init__(self):
@@ -17,6 +68,17 @@ class LoggingConfig:
         self.error_log_file = os.path.join(self.logs_dir, 'error.log')
         self.debug_log_file = os.path.join(self.logs_dir, 'debug.log')
 
+        # Background listener that performs the actual handler I/O
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+        # Buffered file handlers and the thread that flushes them periodically
+        self.flush_interval = 2.0  # seconds
+        self.buffered_handlers: list[logging.handlers.MemoryHandler] = []
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        atexit.register(self.stop_logging)
+
     def setup_logging(self) -> None:
         """
         Configure logging for the application
@@ -29,12 +91,15 @@ class LoggingConfig:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s - [%(filename)s:%(lineno)d]'
         )
 
+        # Format each record's message once, however many handlers it reaches
+        logging.setLogRecordFactory(CachedLogRecord)
+
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.INFO)
 
         # Trading activity logger
-        trading_handler = logging.handlers.RotatingFileHandler(
+        trading_handler = RotatingFileHandler(
             self.trading_log_file,
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5
@@ -43,7 +108,7 @@ class LoggingConfig:
         trading_handler.setFormatter(standard_formatter)
         
         # Error logger
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_handler = RotatingFileHandler(
             self.error_log_file,
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5
@@ -52,7 +117,7 @@ class LoggingConfig:
         error_handler.setFormatter(detailed_formatter)
         
         # Debug logger
-        debug_handler = logging.handlers.RotatingFileHandler(
+        debug_handler = RotatingFileHandler(
             self.debug_log_file,
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5
@@ -65,11 +130,91 @@ class LoggingConfig:
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(standard_formatter)
 
-        # Add handlers to root logger
-        root_logger.addHandler(trading_handler)
-        root_logger.addHandler(error_handler)
-        root_logger.addHandler(debug_handler)
-        root_logger.addHandler(console_handler)
+        if self.listener is not None:
+            self.stop_logging()
+
+        # Drop handlers installed earlier (e.g. by a module-level basicConfig) so
+        # the QueueHandler is the only thing running on the caller's thread
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            handler.close()
+
+        # Batch the high-volume file handlers so many records become one write;
+        # errors flush immediately and the error log itself stays unbuffered
+        buffered_trading_handler = self._buffer(trading_handler, capacity=512)
+        buffered_debug_handler = self._buffer(debug_handler, capacity=2048)
+        self.buffered_handlers = [buffered_trading_handler, buffered_debug_handler]
+
+        # Hand records off through a queue so callers never block on disk I/O;
+        # a background listener thread dispatches them to the real handlers
+        log_queue = queue.SimpleQueue()
+        self.listener = logging.handlers.QueueListener(
+            log_queue,
+            buffered_trading_handler,
+            error_handler,
+            buffered_debug_handler,
+            console_handler,
+            respect_handler_level=True
+        )
+        self.listener.start()
+
+        # Bound how long a buffered record can wait before reaching disk
+        self._flush_stop.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name='log-flush', daemon=True
+        )
+        self._flush_thread.start()
+
+        self.queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger.addHandler(self.queue_handler)
+
+    @staticmethod
+    def _buffer(handler: logging.Handler, capacity: int) -> logging.handlers.MemoryHandler:
+        """
+        Wrap a handler in a MemoryHandler with the same level
+        """
+        buffered = logging.handlers.MemoryHandler(
+            capacity=capacity,
+            flushLevel=logging.ERROR,
+            target=handler,
+            flushOnClose=True
+        )
+        buffered.setLevel(handler.level)
+        return buffered
+
+    def _flush_periodically(self) -> None:
+        """
+        Flush buffered handlers every flush_interval seconds until stopped
+        """
+        while not self._flush_stop.wait(self.flush_interval):
+            for handler in self.buffered_handlers:
+                handler.flush()
+
+    def stop_logging(self) -> None:
+        """
+        Stop the background listener, flushing any queued and buffered records
+        """
+        if self.listener is None:
+            return
+
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.listener.stop()
+
+        self._flush_stop.set()
+        self._flush_thread.join()
+        self._flush_thread = None
+
+        # Close every handler so the log files are released; a MemoryHandler
+        # only flushes on close and drops its target, so close that too
+        for handler in self.listener.handlers:
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
+
+        self.listener = None
+        self.queue_handler = None
+        self.buffered_handlers = []
 
     def get_logger(self, name: str) -> logging.Logger:
         """
@@ -2,37 +2,98 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 import os
+import tempfile
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _get_ticker(symbol):
+    """
+    Shared Ticker per symbol so repeated collectors reuse its cached metadata;
+    yfinance already pools one keep-alive HTTP session across all Tickers
+    """
+    return yf.Ticker(symbol)
 
 class StockDataCollector:
     def __init__(self, symbol):
         self.symbol = symbol
-        self.ticker = yf.Ticker(symbol)
+        self.ticker = _get_ticker(symbol)
         self.data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+        self.cache_dir = os.path.join(self.data_dir, 'cache')
         os.makedirs(self.data_dir, exist_ok=True)
 
-    def fetch_historical_data(self, period="1y", interval="1d"):
+    def fetch_historical_data(self, period="1y", interval="1d", use_cache=False, columns=None):
         """
         Fetch historical data for the specified symbol
         :param period: Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max
         :param interval: Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo
+        :param use_cache: Reuse data already fetched today for the same period and interval
+        :param columns: Columns to keep, e.g. ('Close',); all columns if None
         :return: pandas DataFrame with historical data
         """
-        data = self.ticker.history(period=period, interval=interval)
+        cache_file = os.path.join(
+            self.cache_dir,
+            f"{self.symbol}_{period}_{interval}_{datetime.now().strftime('%Y%m%d')}.parquet"
+        )
+        data = self._read_cache(cache_file, columns) if use_cache else None
+        if data is None:
+            data = self.ticker.history(period=period, interval=interval)
+            if use_cache and not data.empty:
+                self._write_cache(cache_file, data)
+
+        if columns:
+            data = data[list(columns)]
         return data
 
+    def _read_cache(self, cache_file, columns=None):
+        """
+        Load a cached fetch; a missing or unreadable file is a cache miss
+        """
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            return pd.read_parquet(cache_file, columns=list(columns) if columns else None)
+        except Exception as e:
+            print(f"Ignoring unreadable cache file {cache_file}: {e}")
+            return None
+
+    def _write_cache(self, cache_file, data):
+        """
+        Write a fetch to the cache atomically so an interrupted write never
+        leaves a truncated file in place
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            data.to_parquet(tmp_file)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            # Caching is best effort; the fetched data is still returned
+            os.remove(tmp_file)
+            print(f"Could not write cache file {cache_file}: {e}")
+
     def save_data(self, data, filename=None):
         """
-        Save the data to a CSV file
+        Save the data to a Parquet file
         :param data: pandas DataFrame to save
         :param filename: name of the file (optional)
         """
         if filename is None:
-            filename = f"{self.symbol}_{datetime.now().strftime('%Y%m%d')}.csv"
+            filename = f"{self.symbol}_{datetime.now().strftime('%Y%m%d')}.parquet"
         
         filepath = os.path.join(self.data_dir, filename)
-        data.to_csv(filepath)
+        data.to_parquet(filepath, compression='snappy', engine='pyarrow')
         print(f"Data saved to {filepath}")
 
+    def load_data(self, filename):
+        """
+        Load data previously written by save_data
+        :param filename: name of the file in the data directory
+        :return: pandas DataFrame with the saved data
+        """
+        filepath = os.path.join(self.data_dir, filename)
+        return pd.read_parquet(filepath, engine='pyarrow')
+
     def fetch_and_save_data(self, period="1y", interval="1d"):
         """
         Fetch and save historical data in one go
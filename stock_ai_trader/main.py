@@ -38,9 +38,9 @@ def run_trading_system(args):
         interval = args.interval or config.data.default_interval
         symbols = args.symbols or config.trading.symbols
         
-        logger.info(f"Starting trading system in {args.mode} mode")
-        logger.info(f"Trading symbols: {symbols}")
-        logger.info(f"Period: {period}, Interval: {interval}")
+        logger.info("Starting trading system in %s mode", args.mode)
+        logger.info("Trading symbols: %s", symbols)
+        logger.info("Period: %s, Interval: %s", period, interval)
         
         # Initialize simulator with configuration
         simulator = PaperTradingSimulator(
@@ -53,7 +53,11 @@ def run_trading_system(args):
         )
         
         # Run simulation
-        simulator.run_simulation(period=period, interval=interval)
+        simulator.run_simulation(
+            period=period,
+            interval=interval,
+            use_cache=(args.mode == 'backtest')
+        )
         
         # Analyze performance
         analyzer = PerformanceAnalyzer(
@@ -72,7 +76,7 @@ def run_trading_system(args):
         return 0
         
     except Exception as e:
-        logger.error(f"Error running trading system: {str(e)}", exc_info=True)
+        logger.error("Error running trading system: %s", e, exc_info=True)
         return 1
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pandas as pd
+import numpy as np
 from typing import Dict, Optional
 import logging
 import os
@@ -15,16 +17,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Trade record layout; symbols and actions are stored as small integer codes
+TRADE_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[us]'),
+    ('sym_id', 'i2'),
+    ('action', 'i1'),
+    ('price', 'f8'),
+    ('quantity', 'i4'),
+    ('pnl', 'f8'),
+    ('portfolio_value', 'f8'),
+])
+ACTIONS = ('BUY', 'SELL')
+
 class PaperTradingSimulator:
     def __init__(self,
                 symbols: list[str],
                 initial_capital: float = 100000.0,
-                strategy_params: Optional[Dict] = None):
+                strategy_params: Optional[Dict] = None,
+                trade_capacity: int = 1024):
         """
         Initialize the paper trading simulator
         :param symbols: List of stock symbols to trade
         :param initial_capital: Initial capital for trading
         :param strategy_params: Parameters for the trading strategy
+        :param trade_capacity: Initial number of trades to preallocate (grows as needed)
         """
         self.symbols = symbols
         self.initial_capital = initial_capital
@@ -35,7 +51,8 @@ class PaperTradingSimulator:
             max_position_size_pct=0.02,  # 2% max per position
             max_portfolio_risk_pct=0.05,  # 5% max portfolio risk
             max_positions=5,
-            stop_loss_pct=0.02  # 2% stop loss
+            stop_loss_pct=0.02,  # 2% stop loss
+            symbols=symbols
         )
         
         # Initialize strategy with default or provided parameters
@@ -50,59 +67,123 @@ class PaperTradingSimulator:
             symbol: StockDataCollector(symbol) for symbol in symbols
         }
         
-        # Initialize trade log
-        self.trade_log = []
+        # Initialize trade log as a preallocated record array, plus running
+        # P&L counters for win rate
+        self._trades = np.empty(max(1, trade_capacity), dtype=TRADE_DTYPE)
+        self._n_trades = 0
+        self._trade_symbols = list(symbols)
+        self._trade_sym_ids = {symbol: i for i, symbol in enumerate(self._trade_symbols)}
+        self._pnl_count = 0
+        self._win_count = 0
 
     def log_trade(self, symbol: str, action: str, price: float, quantity: int, pnl: Optional[float] = None):
         """
         Log a trade to the trade history
         """
-        trade = {
-            'timestamp': datetime.now(),
-            'symbol': symbol,
-            'action': action,
-            'price': price,
-            'quantity': quantity,
-            'pnl': pnl,
-            'portfolio_value': self.risk_manager.get_portfolio_status()['total_value']
-        }
-        self.trade_log.append(trade)
-        logger.info(f"Trade executed: {trade}")
+        timestamp = datetime.now()
+        portfolio_value = self.risk_manager.get_portfolio_status()['total_value']
+
+        if self._n_trades == len(self._trades):
+            self._trades = np.resize(self._trades, 2 * len(self._trades))
+
+        sym_id = self._trade_sym_ids.get(symbol)
+        if sym_id is None:
+            sym_id = self._trade_sym_ids[symbol] = len(self._trade_symbols)
+            self._trade_symbols.append(symbol)
+
+        self._trades[self._n_trades] = (
+            timestamp,
+            sym_id,
+            ACTIONS.index(action),
+            price,
+            quantity,
+            np.nan if pnl is None else pnl,
+            portfolio_value
+        )
+        self._n_trades += 1
+        if pnl is not None and not np.isnan(pnl):
+            self._pnl_count += 1
+            self._win_count += pnl > 0
+
+        # Only build the trade dict when a handler will actually see it
+        if logger.isEnabledFor(logging.INFO):
+            trade = {
+                'timestamp': timestamp,
+                'symbol': symbol,
+                'action': action,
+                'price': price,
+                'quantity': quantity,
+                'pnl': pnl,
+                'portfolio_value': portfolio_value
+            }
+            logger.info("Trade executed: %s", trade)
 
-    def run_simulation(self, period: str = "1d", interval: str = "5m"):
+    @property
+    def trade_log(self) -> pd.DataFrame:
+        """
+        Trade history as a DataFrame, one row per trade; pnl is NaN for entries
+        """
+        trades = self._trades[:self._n_trades]
+        return pd.DataFrame({
+            'timestamp': trades['timestamp'],
+            'symbol': np.array(self._trade_symbols, dtype=object)[trades['sym_id']],
+            'action': np.array(ACTIONS, dtype=object)[trades['action']],
+            'price': trades['price'],
+            'quantity': trades['quantity'],
+            'pnl': trades['pnl'],
+            'portfolio_value': trades['portfolio_value'],
+        })
+
+    def run_simulation(self, period: str = "1d", interval: str = "5m", use_cache: bool = False):
         """
         Run the paper trading simulation
         :param period: Time period to simulate (e.g., "1d", "5d", "1mo")
         :param interval: Data interval (e.g., "1m", "5m", "15m")
+        :param use_cache: Reuse market data already fetched today instead of downloading it again
         """
         logger.info("Starting paper trading simulation...")
         
-        for symbol in self.symbols:
-            # Fetch latest data
-            collector = self.data_collectors[symbol]
-            data = collector.fetch_historical_data(period=period, interval=interval)
-            
+        # Fetch latest data for all symbols concurrently; each fetch is network-bound.
+        # The strategy only reads Close, so drop the other columns up front
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(self.symbols)))) as executor:
+            data_map = dict(zip(self.symbols, executor.map(
+                lambda symbol: self.data_collectors[symbol].fetch_historical_data(
+                    period=period, interval=interval, use_cache=use_cache,
+                    columns=('Close',)),
+                self.symbols
+            )))
+        
+        for symbol, data in data_map.items():
             # Generate trading signals
             signals = self.strategy.calculate_signals(data)
             
-            # Process each signal
-            for timestamp, row in signals.iterrows():
-                current_price = row['Close']
+            # Process each signal on raw arrays; iterrows would box every bar into a Series
+            closes = signals['Close'].to_numpy(dtype=np.float64)
+            positions = signals['Position'].to_numpy(dtype=np.int8)
+            
+            # Only bars where the signal changes need trade handling; the bars in
+            # between just reprice an open position and may trigger its stop loss
+            event_idx = np.flatnonzero(positions)
+            bounds = np.append(event_idx, len(closes))
+            self.risk_manager.update_position_prices(symbol, closes[:bounds[0]])
+            
+            for i, end in zip(event_idx.tolist(), bounds[1:].tolist()):
+                current_price = float(closes[i])
                 
                 # Check for position entry
-                if row['Position'] == 1:  # Buy signal
+                if positions[i] > 0:  # Buy signal
                     position = self.risk_manager.open_position(symbol, current_price)
                     if position:
                         self.log_trade(symbol, 'BUY', current_price, position.quantity)
                 
                 # Check for position exit
-                elif row['Position'] == -1:  # Sell signal
+                else:  # Sell signal
                     pnl = self.risk_manager.close_position(symbol)
                     if pnl is not None:
                         self.log_trade(symbol, 'SELL', current_price, 0, pnl)
                 
-                # Update existing positions
-                self.risk_manager.update_position(symbol, current_price)
+                # Update existing positions up to the next signal
+                self.risk_manager.update_position_prices(symbol, closes[i:end])
 
     def get_simulation_results(self) -> Dict:
         """
@@ -111,17 +192,11 @@ class PaperTradingSimulator:
         portfolio_status = self.risk_manager.get_portfolio_status()
         
         # Calculate additional metrics
-        trades_df = pd.DataFrame(self.trade_log)
-        if not trades_df.empty:
-            winning_trades = trades_df[trades_df['pnl'] > 0]['pnl'].count()
-            total_trades = trades_df['pnl'].count()
-            win_rate = winning_trades / total_trades if total_trades > 0 else 0
-        else:
-            win_rate = 0
+        win_rate = self._win_count / self._pnl_count if self._pnl_count > 0 else 0
         
         results = {
             **portfolio_status,
-            'total_trades': len(self.trade_log),
+            'total_trades': self._n_trades,
             'win_rate': win_rate * 100,
             'initial_capital': self.initial_capital,
         }
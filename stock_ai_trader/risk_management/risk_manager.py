@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, List
+import numpy as np
 import pandas as pd
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     symbol: str
     quantity: int
@@ -28,14 +29,74 @@ class RiskManager:
                 max_position_size_pct: float = 0.02,  # 2% max per position
                 max_portfolio_risk_pct: float = 0.05,  # 5% max portfolio risk
                 max_positions: int = 5,
-                stop_loss_pct: float = 0.03):  # 3% stop loss
+                stop_loss_pct: float = 0.03,  # 3% stop loss
+                symbols: Optional[List[str]] = None):
         self.initial_capital = initial_capital
         self.current_capital = initial_capital
         self.max_position_size_pct = max_position_size_pct
         self.max_portfolio_risk_pct = max_portfolio_risk_pct
         self.max_positions = max_positions
         self.stop_loss_pct = stop_loss_pct
-        self.positions: Dict[str, Position] = {}
+
+        # Position state as parallel arrays indexed by symbol id
+        symbols = symbols or []
+        capacity = max(len(symbols), 8)
+        self._sym_idx: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self.qty = np.zeros(capacity, dtype=np.int64)
+        self.entry = np.zeros(capacity, dtype=np.float64)
+        self.current = np.zeros(capacity, dtype=np.float64)
+        self.stop = np.zeros(capacity, dtype=np.float64)
+        self.active = np.zeros(capacity, dtype=np.bool_)
+        self._n_active = 0
+
+        # Running market value of open positions, kept in step with the arrays
+        self._positions_value = 0.0
+        for symbol in symbols:
+            self._symbol_id(symbol)
+
+    def _symbol_id(self, symbol: str) -> int:
+        """
+        Get the array index for a symbol, registering it if new
+        """
+        idx = self._sym_idx.get(symbol)
+        if idx is None:
+            idx = len(self._symbols)
+            if idx == len(self.qty):
+                self._grow()
+            self._sym_idx[symbol] = idx
+            self._symbols.append(symbol)
+        return idx
+
+    def _grow(self) -> None:
+        """
+        Double the capacity of the position arrays
+        """
+        extra = len(self.qty)
+        self.qty = np.concatenate((self.qty, np.zeros(extra, dtype=self.qty.dtype)))
+        self.entry = np.concatenate((self.entry, np.zeros(extra, dtype=self.entry.dtype)))
+        self.current = np.concatenate((self.current, np.zeros(extra, dtype=self.current.dtype)))
+        self.stop = np.concatenate((self.stop, np.zeros(extra, dtype=self.stop.dtype)))
+        self.active = np.concatenate((self.active, np.zeros(extra, dtype=self.active.dtype)))
+
+    def _position(self, idx: int) -> Position:
+        """
+        Build a Position snapshot for the symbol at idx
+        """
+        return Position(
+            symbol=self._symbols[idx],
+            quantity=int(self.qty[idx]),
+            entry_price=float(self.entry[idx]),
+            current_price=float(self.current[idx]),
+            stop_loss=float(self.stop[idx])
+        )
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """
+        Open positions keyed by symbol, for reporting
+        """
+        return {self._symbols[idx]: self._position(idx) for idx in np.flatnonzero(self.active)}
 
     def calculate_position_size(self, price: float) -> int:
         """
@@ -49,19 +110,16 @@ class RiskManager:
         Check if a new position can be opened based on risk rules
         """
         # Check maximum positions limit
-        if len(self.positions) >= self.max_positions:
+        if self._n_active >= self.max_positions:
             return False, "Maximum number of positions reached"
 
-        # Calculate potential position value
+        # Calculate potential position value; calculate_position_size already
+        # caps it at max_position_size_pct of current capital
         position_size = self.calculate_position_size(price)
         position_value = position_size * price
 
-        # Check if position size exceeds maximum risk
-        if position_value > self.current_capital * self.max_position_size_pct:
-            return False, "Position size exceeds maximum risk threshold"
-
         # Calculate total portfolio risk including this position
-        total_risk = sum(pos.position_value for pos in self.positions.values())
+        total_risk = self._positions_value
         total_risk += position_value
 
         if total_risk > self.current_capital * self.max_portfolio_risk_pct:
@@ -81,41 +139,66 @@ class RiskManager:
         position_size = self.calculate_position_size(price)
         stop_loss = price * (1 - self.stop_loss_pct)
 
-        position = Position(
-            symbol=symbol,
-            quantity=position_size,
-            entry_price=price,
-            current_price=price,
-            stop_loss=stop_loss
-        )
-
-        self.positions[symbol] = position
-        return position
+        idx = self._symbol_id(symbol)
+        if self.active[idx]:
+            self._positions_value -= float(self.qty[idx] * self.current[idx])
+        else:
+            self._n_active += 1
+        self._positions_value += position_size * price
+        self.qty[idx] = position_size
+        self.entry[idx] = price
+        self.current[idx] = price
+        self.stop[idx] = stop_loss
+        self.active[idx] = True
+        return self._position(idx)
 
     def update_position(self, symbol: str, current_price: float) -> None:
         """
         Update position with current price and check stop loss
         """
-        if symbol not in self.positions:
+        idx = self._sym_idx.get(symbol)
+        if idx is None or not self.active[idx]:
             return
 
-        position = self.positions[symbol]
-        position.current_price = current_price
+        self._positions_value += float(self.qty[idx] * (current_price - self.current[idx]))
+        self.current[idx] = current_price
 
         # Check stop loss
-        if current_price <= position.stop_loss:
+        if current_price <= self.stop[idx]:
             self.close_position(symbol)
             print(f"Stop loss triggered for {symbol}")
 
+    def update_position_prices(self, symbol: str, prices: np.ndarray) -> None:
+        """
+        Apply a run of consecutive prices to a position; equivalent to calling
+        update_position for each price in order
+        """
+        idx = self._sym_idx.get(symbol)
+        if idx is None or not self.active[idx] or len(prices) == 0:
+            return
+
+        # The first price at or below the stop closes the position; otherwise
+        # only the last price matters
+        hits = np.flatnonzero(prices <= self.stop[idx])
+        last = hits[0] if len(hits) else len(prices) - 1
+        self.update_position(symbol, float(prices[last]))
+
     def close_position(self, symbol: str) -> Optional[float]:
         """
         Close a position and return realized P&L
         """
-        if symbol not in self.positions:
+        idx = self._sym_idx.get(symbol)
+        if idx is None or not self.active[idx]:
             return None
 
-        position = self.positions.pop(symbol)
-        pnl = position.unrealized_pnl
+        pnl = float(self.qty[idx] * (self.current[idx] - self.entry[idx]))
+        self._positions_value -= float(self.qty[idx] * self.current[idx])
+        self.active[idx] = False
+        self.qty[idx] = 0
+        self._n_active -= 1
+        if self._n_active == 0:
+            # Drop accumulated rounding error once the book is flat
+            self._positions_value = 0.0
         self.current_capital += pnl
         return pnl
 
@@ -124,14 +207,14 @@ class RiskManager:
         Get current portfolio status and risk metrics
         """
         total_value = self.current_capital
-        positions_value = sum(pos.position_value for pos in self.positions.values())
+        positions_value = self._positions_value
         total_value += positions_value
 
         return {
             "total_value": total_value,
             "cash": self.current_capital,
             "positions_value": positions_value,
-            "number_of_positions": len(self.positions),
+            "number_of_positions": self._n_active,
             "portfolio_return": (total_value - self.initial_capital) / self.initial_capital * 100
         }
 
@@ -2,6 +2,10 @@ import pandas as pd
 import numpy as np
 from typing import Tuple
 
+# Relative gap below which the two SMAs count as equal; prefix-sum rounding
+# is many orders of magnitude smaller than any real crossover
+SMA_TIE_RTOL = 1e-9
+
 class MovingAverageCrossover:
     def __init__(self, short_window: int = 50, long_window: int = 200):
         """
@@ -12,6 +16,25 @@ class MovingAverageCrossover:
         self.short_window = short_window
         self.long_window = long_window
 
+    @staticmethod
+    def _sma(close: np.ndarray, csum: np.ndarray, nan_count: np.ndarray, window: int) -> np.ndarray:
+        """
+        Simple moving average from precomputed prefix sums, O(N) for any window.
+        Matches rolling(window).mean(): NaN until the window is full and for any
+        window that contains a missing price.
+        """
+        sma = np.full(close.shape, np.nan)
+        if window > len(close):
+            return sma
+        
+        window_sum = csum[window - 1:].copy()
+        window_sum[1:] -= csum[:-window]
+        window_nans = nan_count[window - 1:].copy()
+        window_nans[1:] -= nan_count[:-window]
+        
+        sma[window - 1:] = np.where(window_nans == 0, window_sum / window, np.nan)
+        return sma
+
     def calculate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate trading signals based on moving average crossover
@@ -21,17 +44,27 @@ class MovingAverageCrossover:
         # Make a copy of the data
         signals = data.copy()
         
-        # Calculate moving averages
-        signals['SMA_short'] = signals['Close'].rolling(window=self.short_window).mean()
-        signals['SMA_long'] = signals['Close'].rolling(window=self.long_window).mean()
+        # Calculate moving averages from one shared prefix sum
+        close = signals['Close'].to_numpy(dtype=np.float64)
+        missing = np.isnan(close)
+        csum = np.cumsum(np.where(missing, 0.0, close))
+        nan_count = np.cumsum(missing)
+        sma_short = self._sma(close, csum, nan_count, self.short_window)
+        sma_long = self._sma(close, csum, nan_count, self.long_window)
         
-        # Generate signals
-        signals['Signal'] = 0
-        signals.loc[signals['SMA_short'] > signals['SMA_long'], 'Signal'] = 1  # Buy signal
-        signals.loc[signals['SMA_short'] < signals['SMA_long'], 'Signal'] = -1  # Sell signal
+        # Generate signals: 1 = buy, -1 = sell, 0 = no signal (incl. warm-up NaNs).
+        # Prefix sums are not bit-exact on flat prices, so near-ties count as ties
+        gap = sma_short - sma_long
+        gap[np.abs(gap) <= SMA_TIE_RTOL * np.abs(sma_long)] = 0.0
+        signal = np.where(gap > 0, 1, np.where(gap < 0, -1, 0)).astype(np.int8)
         
-        # Generate actual trading orders (signal changes)
-        signals['Position'] = signals['Signal'].diff()
+        # Generate actual trading orders (signal changes): +1/+2 = buy, -1/-2 = sell
+        position = np.diff(signal, prepend=np.int8(0))
+        
+        signals['SMA_short'] = sma_short
+        signals['SMA_long'] = sma_long
+        signals['Signal'] = signal
+        signals['Position'] = position
         
         return signals
 
@@ -44,24 +77,32 @@ class MovingAverageCrossover:
         """
         signals = self.calculate_signals(data)
         
-        # Initialize positions and portfolio
-        positions = pd.DataFrame(index=signals.index).fillna(0.0)
-        positions['Stock'] = signals['Signal']  # 1 for long, -1 for short, 0 for no position
+        stock = signals['Signal'].to_numpy(dtype=np.float64)  # 1 for long, -1 for short, 0 for no position
+        close = signals['Close'].to_numpy(dtype=np.float64)
         
-        # Initialize portfolio value
-        portfolio = pd.DataFrame(index=signals.index)
-        portfolio['Position'] = positions['Stock'] * signals['Close']
-        portfolio['Cash'] = initial_capital - (positions['Stock'].diff() * signals['Close']).cumsum()
-        portfolio['Total'] = portfolio['Cash'] + portfolio['Position']
+        # Portfolio value: holdings marked to market plus cash after each trade
+        position_value = stock * close
+        delta = np.empty_like(stock)
+        delta[0] = 0.0
+        np.subtract(stock[1:], stock[:-1], out=delta[1:])
+        # nan-aware reductions keep pandas' skipna behaviour for missing closes
+        cash = initial_capital - np.nancumsum(delta * close)
+        total = cash + position_value
         
         # Calculate metrics
-        returns = portfolio['Total'].pct_change()
+        returns = np.diff(total) / total[:-1]
+        running_max = np.fmax.accumulate(total)
         metrics = {
-            'Total Return': (portfolio['Total'][-1] - initial_capital) / initial_capital * 100,
-            'Sharpe Ratio': np.sqrt(252) * returns.mean() / returns.std(),
-            'Max Drawdown': (portfolio['Total'] / portfolio['Total'].cummax() - 1).min() * 100
+            'Total Return': (total[-1] - initial_capital) / initial_capital * 100,
+            'Sharpe Ratio': np.sqrt(252) * np.nanmean(returns) / np.nanstd(returns, ddof=1) if len(returns) > 1 else np.nan,
+            'Max Drawdown': np.nanmin((total / running_max) - 1) * 100
         }
         
+        portfolio = pd.DataFrame(
+            {'Position': position_value, 'Cash': cash, 'Total': total},
+            index=signals.index
+        )
+        
         return portfolio, metrics
 
 if __name__ == "__main__":